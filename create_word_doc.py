@@ -1,6 +1,10 @@
+import copy
+import hashlib
+import io
+import os
+
 from docx import Document
-from docx.shared import Pt, RGBColor, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt, RGBColor, Inches, Emu
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
@@ -13,27 +17,276 @@ font = style.font
 font.name = 'Calibri'
 font.size = Pt(11)
 
-# Title
-title = doc.add_paragraph()
-title_run = title.add_run('Spring Boot E-Commerce Backend')
-title_run.font.size = Pt(28)
-title_run.font.bold = True
-title_run.font.color.rgb = RGBColor(0, 51, 102)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-# Subtitle
-subtitle = doc.add_paragraph()
-subtitle_run = subtitle.add_run('Complete Architecture Guide')
-subtitle_run.font.size = Pt(18)
-subtitle_run.font.italic = True
-subtitle_run.font.color.rgb = RGBColor(51, 102, 153)
-subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-doc.add_paragraph()  # Space
+# Resolve shared styles once instead of looking them up by name per paragraph
+BULLET = doc.styles['List Bullet']
+NUMBER = doc.styles['List Number']
+HEADINGS = tuple(doc.styles[f'Heading {n}'] for n in (1, 2, 3))
+TABLE_STYLE = doc.styles['Light Grid Accent 1']
+COURIER = 'Courier New'
+
+# Shared sizes and colours, built once and reused by every run that needs them
+PT12 = Pt(12)
+PT18 = Pt(18)
+PT28 = Pt(28)
+DARK_BLUE = RGBColor(0, 51, 102)
+MID_BLUE = RGBColor(51, 102, 153)
+GREEN = RGBColor(0, 102, 0)
+STEP_FORMAT = {'size': PT12, 'bold': True}
+
+# Low-level paragraph builders: construct <w:p> subtrees directly instead of
+# going through python-docx's Paragraph/Run wrappers for every item.
+body = doc.element.body
+W_VAL = qn('w:val')
+W_W = qn('w:w')
+
+
+def _prototype(tag, *children):
+    element = OxmlElement(tag)
+    element.extend(children)
+    return element
+
+
+# Prototype elements are cloned with copy.deepcopy(), a single call into
+# lxml, rather than assembled tag by tag through OxmlElement() per item
+_P = _prototype('w:p')
+_STYLED_P = _prototype('w:p', _prototype('w:pPr', _prototype('w:pStyle')))
+_RUN = _prototype('w:r')
+_BOLD_RUN = _prototype('w:r', _prototype('w:rPr', _prototype('w:b')))
+_T = _prototype('w:t')
+_PRESERVED_T = _prototype('w:t')
+_PRESERVED_T.set(qn('xml:space'), 'preserve')
+_BR = _prototype('w:br')
+_CODE_FONTS = _prototype('w:rFonts')
+_CODE_FONTS.set(qn('w:ascii'), COURIER)
+_CODE_FONTS.set(qn('w:hAnsi'), COURIER)
+_CODE_RUN = _prototype('w:r', _prototype('w:rPr', _CODE_FONTS))
+
+_TBL_W = _prototype('w:tblW')
+_TBL_W.set(qn('w:type'), 'auto')
+_TBL_W.set(W_W, '0')
+_TBL_LOOK = _prototype('w:tblLook')
+for name, value in (('firstColumn', '1'), ('firstRow', '1'), ('lastColumn', '0'),
+                    ('lastRow', '0'), ('noHBand', '0'), ('noVBand', '1'), ('val', '04A0')):
+    _TBL_LOOK.set(qn(f'w:{name}'), value)
+_TBL = _prototype(
+    'w:tbl',
+    _prototype('w:tblPr', _prototype('w:tblStyle'), _TBL_W, _TBL_LOOK),
+    _prototype('w:tblGrid'),
+)
+_GRID_COL = _prototype('w:gridCol')
+_TC_W = _prototype('w:tcW')
+_TC_W.set(qn('w:type'), 'dxa')
+_TC = _prototype('w:tc', _prototype('w:tcPr', _TC_W))
+_TR = _prototype('w:tr')
 
-# Table of Contents
-doc.add_heading('Table of Contents', level=1)
-toc_items = [
+_PAGE_BR = _prototype('w:br')
+_PAGE_BR.set(qn('w:type'), 'page')
+_PAGE_BREAK = _prototype('w:p', _prototype('w:r', _PAGE_BR))
+_CENTERED = _prototype('w:jc')
+_CENTERED.set(W_VAL, 'center')
+_CENTERED_P = _prototype('w:p', _prototype('w:pPr', _CENTERED))
+
+
+def _fill_run(r, text):
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            r.append(copy.deepcopy(_BR))
+        if not line:
+            continue
+        t = copy.deepcopy(_PRESERVED_T if line != line.strip() else _T)
+        t.text = line
+        r.append(t)
+    return r
+
+
+def make_run(text, bold=False):
+    return _fill_run(copy.deepcopy(_BOLD_RUN if bold else _RUN), text)
+
+
+def make_code_run(text):
+    return _fill_run(copy.deepcopy(_CODE_RUN), text)
+
+
+def make_paragraph(*runs, style_id=None):
+    if style_id is None:
+        p = copy.deepcopy(_P)
+    else:
+        p = copy.deepcopy(_STYLED_P)
+        p[0][0].set(W_VAL, style_id)
+    p.extend(runs)
+    return p
+
+
+def make_bullet(text, style_id=BULLET.style_id):
+    return make_paragraph(make_run(text), style_id=style_id)
+
+
+def make_bold_prefixed(prefix, text):
+    return make_paragraph(make_run(prefix, bold=True), make_run(text))
+
+
+def numbered_bold(idx, label, text):
+    return make_bold_prefixed(f'{idx}. {label}: ', text)
+
+
+def make_emphasis(text, fmt):
+    # rPr children must follow the schema order: b, i, color, sz
+    rPr = OxmlElement('w:rPr')
+    if fmt.get('bold'):
+        rPr.append(OxmlElement('w:b'))
+    if fmt.get('italic'):
+        rPr.append(OxmlElement('w:i'))
+    if 'color' in fmt:
+        rPr.append(OxmlElement('w:color', {W_VAL: str(fmt['color'])}))
+    rPr.append(OxmlElement('w:sz', {W_VAL: str(int(fmt['size'].pt * 2))}))
+    r = copy.deepcopy(_RUN)
+    r.append(rPr)
+    p = copy.deepcopy(_CENTERED_P if fmt.get('centered') else _P)
+    p.append(_fill_run(r, text))
+    return p
+
+
+def make_table(rows, style_id=TABLE_STYLE.style_id):
+    # Columns split the text width evenly, as doc.add_table() does
+    section = doc.sections[-1]
+    block_width = section.page_width - section.left_margin - section.right_margin
+    col_width = str(Emu(block_width // len(rows[0])).twips)
+
+    tbl = copy.deepcopy(_TBL)
+    tblPr, tblGrid = tbl
+    tblPr[0].set(W_VAL, style_id)
+    for _ in rows[0]:
+        gridCol = copy.deepcopy(_GRID_COL)
+        gridCol.set(W_W, col_width)
+        tblGrid.append(gridCol)
+    for values in rows:
+        tr = copy.deepcopy(_TR)
+        for value in values:
+            tc = copy.deepcopy(_TC)
+            tc[0][0].set(W_W, col_width)
+            tc.append(make_paragraph(make_run(value)))
+            tr.append(tc)
+        tbl.append(tr)
+    return tbl
+
+
+def append_elements(elements):
+    # Insert ahead of the trailing <w:sectPr>, as add_paragraph() does, in a
+    # single bulk lxml operation
+    sectPr = body.sectPr
+    index = len(body) if sectPr is None else body.index(sectPr)
+    body[index:index] = elements
+
+
+# Renderers: one per content shape, dispatched from SECTIONS below. Each
+# returns the elements it built; render_section() inserts them in one go.
+
+
+def render_heading(level, text):
+    style_id = HEADINGS[level - 1].style_id
+    return [make_paragraph(make_run(text), style_id=style_id)]
+
+
+def render_para(text=''):
+    if not text:
+        return [make_paragraph()]
+    return [make_paragraph(make_run(text))]
+
+
+def render_bold(text):
+    return [make_paragraph(make_run(text, bold=True))]
+
+
+def render_emphasis(text, fmt):
+    return [make_emphasis(text, fmt)]
+
+
+def render_bullets(items):
+    return [make_bullet(item) for item in items]
+
+
+def render_numbers(items):
+    return [make_bullet(item, NUMBER.style_id) for item in items]
+
+
+def render_pairs(pairs):
+    return [make_bold_prefixed(label, text) for label, text in pairs]
+
+
+def render_steps(steps):
+    return [numbered_bold(idx, *step) for idx, step in enumerate(steps, 1)]
+
+
+def render_glossary(entries):
+    elements = []
+    for name, desc in entries:
+        elements.append(make_paragraph(make_run(name, bold=True)))
+        elements.append(make_bullet(desc))
+    return elements
+
+
+def render_code(text, style=BULLET):
+    # Set the font on the run only; the paragraph style is shared
+    style_id = None if style is None else style.style_id
+    return [make_paragraph(make_code_run(text), style_id=style_id)]
+
+
+def render_annotations(annotations):
+    elements = []
+    for name, code, explanation in annotations:
+        elements += render_heading(3, name)
+        elements += render_bold('Code:')
+        elements += render_code(code)
+        elements += render_bold('Explanation:')
+        elements += render_bullets((explanation,))
+    return elements
+
+
+def render_entries(entries):
+    elements = []
+    for name, explanation in entries:
+        elements += render_heading(3, name)
+        elements += render_para(explanation)
+    return elements
+
+
+def render_lifecycle(steps):
+    elements = []
+    for num, (step, details) in enumerate(steps, 1):
+        elements += render_emphasis(f'Step {num}: {step}', STEP_FORMAT)
+        elements += render_bullets((details,))
+    return elements
+
+
+def render_table(rows):
+    return [make_table(rows)]
+
+
+def render_page_break():
+    return [copy.deepcopy(_PAGE_BREAK)]
+
+
+DISPATCH = {
+    'heading': render_heading,
+    'para': render_para,
+    'bold': render_bold,
+    'emphasis': render_emphasis,
+    'bullets': render_bullets,
+    'numbers': render_numbers,
+    'pairs': render_pairs,
+    'steps': render_steps,
+    'glossary': render_glossary,
+    'code': render_code,
+    'annotations': render_annotations,
+    'entries': render_entries,
+    'lifecycle': render_lifecycle,
+    'table': render_table,
+    'page_break': render_page_break,
+}
+
+# ===== CONTENT =====
+
+TOC_ITEMS = (
     '1. Overview',
     '2. Architecture & Flow',
     '3. Technology Stack',
@@ -42,210 +295,91 @@ toc_items = [
     '6. Database & ORM Concepts',
     '7. API Endpoints',
     '8. Request-Response Lifecycle'
-]
-for item in toc_items:
-    doc.add_paragraph(item, style='List Bullet')
-
-doc.add_page_break()
-
-# ===== SECTION 1: OVERVIEW =====
-doc.add_heading('1. Overview', level=1)
-doc.add_paragraph(
-    'Your project is a REST API backend for an e-commerce application that allows users to:'
 )
-overview_items = [
+
+OVERVIEW_ITEMS = (
     'View all products',
     'View a single product',
     'Upload products with images',
     'Retrieve product images'
-]
-for item in overview_items:
-    doc.add_paragraph(item, style='List Bullet')
-
-doc.add_paragraph()
-doc.add_paragraph('The architecture follows the Layered/Tier Architecture pattern:')
-
-# Architecture diagram
-arch_text = doc.add_paragraph()
-arch_text.add_run('Client (Browser/Mobile App)\n').font.bold = True
-doc.add_paragraph('↓', style='List Bullet')
-arch_text = doc.add_paragraph()
-arch_text.add_run('Controller Layer').font.bold = True
-arch_text.add_run(' ← Handles HTTP requests/responses')
-doc.add_paragraph('↓', style='List Bullet')
-arch_text = doc.add_paragraph()
-arch_text.add_run('Service Layer').font.bold = True
-arch_text.add_run(' ← Business logic')
-doc.add_paragraph('↓', style='List Bullet')
-arch_text = doc.add_paragraph()
-arch_text.add_run('Repository Layer').font.bold = True
-arch_text.add_run(' ← Database access')
-doc.add_paragraph('↓', style='List Bullet')
-arch_text = doc.add_paragraph()
-arch_text.add_run('Database (H2)').font.bold = True
-arch_text.add_run(' ← Data storage')
-
-doc.add_page_break()
-
-# ===== SECTION 2: ARCHITECTURE & FLOW =====
-doc.add_heading('2. Architecture & Flow', level=1)
-
-# Layer 1
-doc.add_heading('Layer 1: Controller Layer (ProductController.java)', level=2)
-doc.add_heading('Purpose:', level=3)
-doc.add_paragraph('Handle incoming HTTP requests and send responses back to clients.')
+)
 
-doc.add_heading('How it works:', level=3)
-controller_points = [
+CONTROLLER_POINTS = (
     'Receives HTTP requests (GET, POST, etc.)',
     'Parses request data (path variables, request body, file uploads)',
     'Calls business logic from the Service layer',
     'Sends HTTP responses back (JSON, images, etc.)',
     'Handles HTTP status codes (200 OK, 201 CREATED, 404 NOT FOUND, 500 ERROR)'
-]
-for point in controller_points:
-    doc.add_paragraph(point, style='List Bullet')
-
-doc.add_heading('Your Controllers:', level=3)
-table = doc.add_table(rows=5, cols=2)
-table.style = 'Light Grid Accent 1'
-table.rows[0].cells[0].text = 'HTTP Method & Path'
-table.rows[0].cells[1].text = 'Purpose'
-table.rows[1].cells[0].text = 'GET /api/products'
-table.rows[1].cells[1].text = 'Get all products'
-table.rows[2].cells[0].text = 'GET /api/product/{id}'
-table.rows[2].cells[1].text = 'Get single product by ID'
-table.rows[3].cells[0].text = 'POST /api/product'
-table.rows[3].cells[1].text = 'Add new product with image'
-table.rows[4].cells[0].text = 'GET /api/product/{productId}/image'
-table.rows[4].cells[1].text = 'Download product image'
-
-doc.add_paragraph()
-
-# Layer 2
-doc.add_heading('Layer 2: Service Layer (ProductService.java)', level=2)
-doc.add_heading('Purpose:', level=3)
-doc.add_paragraph('Contains business logic, data validation, and orchestration.')
-
-doc.add_heading('How it works:', level=3)
-service_points = [
+)
+
+CONTROLLER_TABLE = (
+    ('HTTP Method & Path', 'Purpose'),
+    ('GET /api/products', 'Get all products'),
+    ('GET /api/product/{id}', 'Get single product by ID'),
+    ('POST /api/product', 'Add new product with image'),
+    ('GET /api/product/{productId}/image', 'Download product image')
+)
+
+SERVICE_POINTS = (
     'Receives data from the Controller',
     'Processes the business logic (e.g., converting image file to bytes)',
     'Validates data before saving',
     'Calls the Repository to access the database',
     'Returns processed data back to the Controller'
-]
-for point in service_points:
-    doc.add_paragraph(point, style='List Bullet')
+)
 
-doc.add_heading('Your Service Methods:', level=3)
-service_methods = [
+SERVICE_METHODS = (
     'getAllProducts() → Retrieves all products from database',
     'getProductById(int id) → Retrieves a specific product',
     'addProduct(product, file) → Saves product + converts image to binary'
-]
-for method in service_methods:
-    doc.add_paragraph(method, style='List Bullet')
-
-# Layer 3
-doc.add_heading('Layer 3: Repository Layer (ProductRepo.java)', level=2)
-doc.add_heading('Purpose:', level=3)
-doc.add_paragraph('Database access abstraction. Uses Spring Data JPA.')
+)
 
-doc.add_heading('How it works:', level=3)
-repo_points = [
+REPO_POINTS = (
     'Extends JpaRepository<Product, Integer>',
     'Provides pre-built methods: findAll(), findById(), save(), delete(), etc.',
     'No need to write SQL queries for basic CRUD operations',
     'Spring automatically generates database queries'
-]
-for point in repo_points:
-    doc.add_paragraph(point, style='List Bullet')
+)
 
-doc.add_heading('What JpaRepository provides (out of the box):', level=3)
-jpa_methods = [
+JPA_METHODS = (
     'save(entity) → INSERT or UPDATE',
     'findAll() → SELECT *',
     'findById(id) → SELECT WHERE id = ?',
     'delete(entity) → DELETE',
     'count() → COUNT(*)',
     '... and many more'
-]
-for method in jpa_methods:
-    doc.add_paragraph(method, style='List Bullet')
-
-# Layer 4 & 5
-doc.add_heading('Layer 4: Model/Entity Layer (Product.java)', level=2)
-doc.add_heading('Purpose:', level=3)
-doc.add_paragraph('Defines the database table structure as a Java class.')
+)
 
-doc.add_heading('How it works:', level=3)
-model_points = [
+MODEL_POINTS = (
     'Each class with @Entity annotation = one database table',
     'Each field with @Id = primary key',
     'Each private field = one database column',
     'JPA/Hibernate automatically creates/updates the table'
-]
-for point in model_points:
-    doc.add_paragraph(point, style='List Bullet')
-
-doc.add_heading('Layer 5: Database (H2 In-Memory)', level=2)
-doc.add_heading('Purpose:', level=3)
-doc.add_paragraph('Stores all data persistently (during runtime).')
+)
 
-doc.add_heading('Current Setup:', level=3)
-db_setup = [
+DB_SETUP = (
     'H2 embedded database (in-memory)',
     'URL: jdbc:h2:mem:ecomdb',
     'Automatically creates tables when application starts',
     'Data is lost when application stops'
-]
-for item in db_setup:
-    doc.add_paragraph(item, style='List Bullet')
-
-doc.add_page_break()
-
-# ===== SECTION 3: TECHNOLOGY STACK =====
-doc.add_heading('3. Technology Stack', level=1)
-doc.add_heading('Dependencies (from pom.xml):', level=2)
-
-dependencies = [
-    {
-        'name': 'spring-boot-starter-data-jpa',
-        'desc': 'Provides JPA (Java Persistence API) interface. Enables Hibernate ORM (Object-Relational Mapping). Converts Java objects to database records.'
-    },
-    {
-        'name': 'spring-boot-starter-web',
-        'desc': 'Provides REST API capabilities. Includes embedded Tomcat server. Handles HTTP requests/responses. Makes your application a web server.'
-    },
-    {
-        'name': 'spring-boot-devtools',
-        'desc': 'Auto-restarts application when files change. Faster development cycle.'
-    },
-    {
-        'name': 'h2 (H2 Database)',
-        'desc': 'Lightweight, in-memory database. Good for learning and testing. Stores your product data.'
-    },
-    {
-        'name': 'lombok',
-        'desc': 'Reduces boilerplate Java code. Auto-generates getters, setters, constructors. Annotations: @Data, @AllArgsConstructor, @NoArgsConstructor'
-    }
-]
-
-for dep in dependencies:
-    p = doc.add_paragraph()
-    p_run = p.add_run(dep['name'])
-    p_run.bold = True
-    doc.add_paragraph(dep['desc'], style='List Bullet')
-
-doc.add_page_break()
-
-# ===== SECTION 4: HOW COMPONENTS CONNECT =====
-doc.add_heading('4. How Components Connect', level=1)
+)
 
-doc.add_heading('Example 1: GET /api/products Request Flow', level=2)
+# (name, description)
+DEPENDENCIES = (
+    ('spring-boot-starter-data-jpa',
+     'Provides JPA (Java Persistence API) interface. Enables Hibernate ORM (Object-Relational Mapping). Converts Java objects to database records.'),
+    ('spring-boot-starter-web',
+     'Provides REST API capabilities. Includes embedded Tomcat server. Handles HTTP requests/responses. Makes your application a web server.'),
+    ('spring-boot-devtools',
+     'Auto-restarts application when files change. Faster development cycle.'),
+    ('h2 (H2 Database)',
+     'Lightweight, in-memory database. Good for learning and testing. Stores your product data.'),
+    ('lombok',
+     'Reduces boilerplate Java code. Auto-generates getters, setters, constructors. Annotations: @Data, @AllArgsConstructor, @NoArgsConstructor')
+)
 
-flow_steps = [
+# (component, action)
+FLOW_STEPS = (
     ('CLIENT sends', 'GET http://localhost:8080/api/products'),
     ('TOMCAT SERVLET', 'embedded web server receives request'),
     ('SPRING DISPATCHER', 'detects @GetMapping("/products")'),
@@ -258,18 +392,9 @@ flow_steps = [
     ('CONTROLLER', 'wraps in ResponseEntity with HTTP 200 OK'),
     ('SPRING JACKSON', 'converts List<Product> → JSON'),
     ('CLIENT', 'receives JSON response with all products')
-]
-
-for step_num, (component, action) in enumerate(flow_steps, 1):
-    p = doc.add_paragraph()
-    p_run = p.add_run(f'{step_num}. {component}: ')
-    p_run.bold = True
-    p.add_run(action)
-
-doc.add_paragraph()
-doc.add_heading('Example 2: POST /api/product Request Flow (with Image Upload)', level=2)
+)
 
-flow_steps_2 = [
+FLOW_STEPS_2 = (
     ('CLIENT sends', 'POST http://localhost:8080/api/product with FormData (product + imageFile)'),
     ('SPRING MULTIPART HANDLER', 'parses the FormData'),
     ('CONTROLLER', 'executes: addProduct(Product, MultipartFile)'),
@@ -283,205 +408,92 @@ flow_steps_2 = [
     ('CONTROLLER', 'returns ResponseEntity with HTTP 201 CREATED'),
     ('JACKSON', 'converts Product to JSON (imageData excluded by @JsonIgnore)'),
     ('CLIENT', 'receives HTTP 201 with created product data')
-]
-
-for step_num, (component, action) in enumerate(flow_steps_2, 1):
-    p = doc.add_paragraph()
-    p_run = p.add_run(f'{step_num}. {component}: ')
-    p_run.bold = True
-    p.add_run(action)
-
-doc.add_page_break()
+)
 
-# ===== SECTION 5: KEY ANNOTATIONS =====
-doc.add_heading('5. Key Annotations Explained', level=1)
-
-doc.add_heading('Controller Annotations', level=2)
-
-annotations = [
-    {
-        'name': '@RestController',
-        'code': '@RestController\npublic class ProductController { ... }',
-        'explanation': 'Tells Spring: "This class handles REST API requests". Every method returns JSON/data automatically (not HTML templates). Combines @Controller + @ResponseBody'
-    },
-    {
-        'name': '@RequestMapping("/api")',
-        'code': '@RequestMapping("/api")\npublic class ProductController { ... }',
-        'explanation': 'Base URL prefix for all endpoints in this controller. All endpoints start with /api/. Example: Full URL becomes /api/products'
-    },
-    {
-        'name': '@CrossOrigin',
-        'code': '@CrossOrigin\npublic class ProductController { ... }',
-        'explanation': 'Allows requests from different domains/ports. Without this: Frontend on port 3000 cannot call backend on port 8080. CORS = Cross-Origin Resource Sharing'
-    },
-    {
-        'name': '@GetMapping("/products")',
-        'code': '@GetMapping("/products")\npublic ResponseEntity<List<Product>> getAllProducts() { ... }',
-        'explanation': 'Maps HTTP GET requests to /api/products to this method. Similar: @PostMapping, @PutMapping, @DeleteMapping'
-    },
-    {
-        'name': '@PostMapping(value = "/product", consumes = {"multipart/form-data"})',
-        'code': '@PostMapping(value = "/product", consumes = {"multipart/form-data"})\npublic ResponseEntity<?> addProduct(...) { ... }',
-        'explanation': 'Maps HTTP POST requests to /api/product. consumes = {"multipart/form-data"} means: Accept file uploads (FormData). Without this: Cannot accept image files'
-    },
-    {
-        'name': '@PathVariable',
-        'code': '@GetMapping("/product/{id}")\npublic ResponseEntity<Product> getProduct(@PathVariable int id) { ... }',
-        'explanation': 'Extracts URL parameter {id} as a Java variable. Example: /product/5 → id = 5'
-    },
-    {
-        'name': '@RequestPart',
-        'code': '@PostMapping("/product")\npublic ResponseEntity<?> addProduct(\n    @RequestPart Product product,\n    @RequestPart MultipartFile imageFile\n) { ... }',
-        'explanation': 'Extracts named form fields from multipart request. @RequestPart Product → Extract form field named "product". @RequestPart MultipartFile → Extract file upload named "imageFile"'
-    }
-]
-
-for ann in annotations:
-    doc.add_heading(ann['name'], level=3)
-    p = doc.add_paragraph()
-    p_run = p.add_run('Code:')
-    p_run.bold = True
-    code_para = doc.add_paragraph(ann['code'], style='List Bullet')
-    code_para.style.font.name = 'Courier New'
-
-    p = doc.add_paragraph()
-    p_run = p.add_run('Explanation:')
-    p_run.bold = True
-    doc.add_paragraph(ann['explanation'], style='List Bullet')
-
-doc.add_heading('Entity/Model Annotations', level=2)
-
-entity_annotations = [
-    {
-        'name': '@Entity',
-        'explanation': 'Tells JPA: "This class represents a database table". Table name = class name (lowercase by default). Product class → product table'
-    },
-    {
-        'name': '@Id',
-        'explanation': 'Marks this field as PRIMARY KEY. Must be unique for each record. Used to uniquely identify a product.'
-    },
-    {
-        'name': '@GeneratedValue(strategy = GenerationType.IDENTITY)',
-        'explanation': 'Auto-generates ID value when new product is inserted. IDENTITY = Database auto-increment (incrementing numbers). You don\'t set ID manually; database does it.'
-    },
-    {
-        'name': '@Lob (Large Object)',
-        'explanation': 'Tells JPA: This field stores large binary data. byte[] = array of bytes (binary image data). Stores in BLOB column in database.'
-    },
-    {
-        'name': '@Basic(fetch = FetchType.LAZY)',
-        'explanation': 'LAZY = Don\'t load this field by default. When you fetch a Product, imageData is NOT loaded (saves memory/bandwidth). Load imageData only when explicitly accessed. Good for large binary data.'
-    },
-    {
-        'name': '@JsonIgnore',
-        'explanation': 'When converting Product to JSON: skip this field. Why: Don\'t send huge binary data in API response. Instead: Provide separate /image endpoint to download.'
-    },
-    {
-        'name': '@JsonIgnoreProperties',
-        'explanation': 'Ignores Hibernate proxy fields when serializing to JSON. Prevents JSON serialization errors.'
-    },
-    {
-        'name': '@Data (Lombok)',
-        'explanation': 'Auto-generates: getters, setters, toString(), equals(), hashCode(). Reduces boilerplate code. Combines: @Getter + @Setter + @ToString + @EqualsAndHashCode'
-    },
-    {
-        'name': '@AllArgsConstructor (Lombok)',
-        'explanation': 'Auto-generates constructor with all fields as parameters. Example: new Product(id, name, brand, price, ...)'
-    },
-    {
-        'name': '@NoArgsConstructor (Lombok)',
-        'explanation': 'Auto-generates empty constructor. Example: new Product()'
-    }
-]
-
-for ann in entity_annotations:
-    doc.add_heading(ann['name'], level=3)
-    doc.add_paragraph(ann['explanation'])
-
-doc.add_heading('Service Annotations', level=2)
-
-service_annotations = [
-    {
-        'name': '@Service',
-        'explanation': 'Tells Spring: "This is a service class (business logic)". Spring automatically creates an instance (bean) of this class. Can be injected into other classes.'
-    },
-    {
-        'name': '@Autowired',
-        'explanation': 'Tells Spring: "Automatically inject an instance of ProductService". Dependency Injection: Spring finds and provides the object. Don\'t use new ProductService() manually.'
-    }
-]
-
-for ann in service_annotations:
-    doc.add_heading(ann['name'], level=3)
-    doc.add_paragraph(ann['explanation'])
-
-doc.add_heading('Repository Annotations', level=2)
-doc.add_heading('@Repository', level=3)
-doc.add_paragraph('Tells Spring: "This is a data access object". Enables automatic SQL generation. <Product, Integer> = Entity type, Primary Key type.')
-
-doc.add_page_break()
+# (name, code, explanation)
+ANNOTATIONS = (
+    ('@RestController',
+     '@RestController\npublic class ProductController { ... }',
+     'Tells Spring: "This class handles REST API requests". Every method returns JSON/data automatically (not HTML templates). Combines @Controller + @ResponseBody'),
+    ('@RequestMapping("/api")',
+     '@RequestMapping("/api")\npublic class ProductController { ... }',
+     'Base URL prefix for all endpoints in this controller. All endpoints start with /api/. Example: Full URL becomes /api/products'),
+    ('@CrossOrigin',
+     '@CrossOrigin\npublic class ProductController { ... }',
+     'Allows requests from different domains/ports. Without this: Frontend on port 3000 cannot call backend on port 8080. CORS = Cross-Origin Resource Sharing'),
+    ('@GetMapping("/products")',
+     '@GetMapping("/products")\npublic ResponseEntity<List<Product>> getAllProducts() { ... }',
+     'Maps HTTP GET requests to /api/products to this method. Similar: @PostMapping, @PutMapping, @DeleteMapping'),
+    ('@PostMapping(value = "/product", consumes = {"multipart/form-data"})',
+     '@PostMapping(value = "/product", consumes = {"multipart/form-data"})\npublic ResponseEntity<?> addProduct(...) { ... }',
+     'Maps HTTP POST requests to /api/product. consumes = {"multipart/form-data"} means: Accept file uploads (FormData). Without this: Cannot accept image files'),
+    ('@PathVariable',
+     '@GetMapping("/product/{id}")\npublic ResponseEntity<Product> getProduct(@PathVariable int id) { ... }',
+     'Extracts URL parameter {id} as a Java variable. Example: /product/5 → id = 5'),
+    ('@RequestPart',
+     '@PostMapping("/product")\npublic ResponseEntity<?> addProduct(\n    @RequestPart Product product,\n    @RequestPart MultipartFile imageFile\n) { ... }',
+     'Extracts named form fields from multipart request. @RequestPart Product → Extract form field named "product". @RequestPart MultipartFile → Extract file upload named "imageFile"')
+)
 
-# ===== SECTION 6: DATABASE & ORM =====
-doc.add_heading('6. Database & ORM Concepts', level=1)
+# (name, explanation)
+ENTITY_ANNOTATIONS = (
+    ('@Entity',
+     'Tells JPA: "This class represents a database table". Table name = class name (lowercase by default). Product class → product table'),
+    ('@Id',
+     'Marks this field as PRIMARY KEY. Must be unique for each record. Used to uniquely identify a product.'),
+    ('@GeneratedValue(strategy = GenerationType.IDENTITY)',
+     'Auto-generates ID value when new product is inserted. IDENTITY = Database auto-increment (incrementing numbers). You don\'t set ID manually; database does it.'),
+    ('@Lob (Large Object)',
+     'Tells JPA: This field stores large binary data. byte[] = array of bytes (binary image data). Stores in BLOB column in database.'),
+    ('@Basic(fetch = FetchType.LAZY)',
+     'LAZY = Don\'t load this field by default. When you fetch a Product, imageData is NOT loaded (saves memory/bandwidth). Load imageData only when explicitly accessed. Good for large binary data.'),
+    ('@JsonIgnore',
+     'When converting Product to JSON: skip this field. Why: Don\'t send huge binary data in API response. Instead: Provide separate /image endpoint to download.'),
+    ('@JsonIgnoreProperties',
+     'Ignores Hibernate proxy fields when serializing to JSON. Prevents JSON serialization errors.'),
+    ('@Data (Lombok)',
+     'Auto-generates: getters, setters, toString(), equals(), hashCode(). Reduces boilerplate code. Combines: @Getter + @Setter + @ToString + @EqualsAndHashCode'),
+    ('@AllArgsConstructor (Lombok)',
+     'Auto-generates constructor with all fields as parameters. Example: new Product(id, name, brand, price, ...)'),
+    ('@NoArgsConstructor (Lombok)',
+     'Auto-generates empty constructor. Example: new Product()')
+)
 
-doc.add_heading('What is ORM (Object-Relational Mapping)?', level=2)
-doc.add_paragraph('ORM bridges Java objects and database tables:')
+SERVICE_ANNOTATIONS = (
+    ('@Service',
+     'Tells Spring: "This is a service class (business logic)". Spring automatically creates an instance (bean) of this class. Can be injected into other classes.'),
+    ('@Autowired',
+     'Tells Spring: "Automatically inject an instance of ProductService". Dependency Injection: Spring finds and provides the object. Don\'t use new ProductService() manually.')
+)
 
-doc.add_paragraph()
-orm_points = [
+ORM_POINTS = (
     'Product class ↔ product table',
     'Product object ↔ product row',
     'id field ↔ id column',
     'name field ↔ name column',
     'imageData field ↔ image_data column'
-]
-for point in orm_points:
-    doc.add_paragraph(point, style='List Bullet')
+)
 
-doc.add_heading('Benefits:', level=3)
-benefits = [
+BENEFITS = (
     'Write Java code instead of SQL queries',
     'Database agnostic (switch from H2 to MySQL easily)',
     'Automatic type conversion (Java types ↔ SQL types)'
-]
-for benefit in benefits:
-    doc.add_paragraph(benefit, style='List Bullet')
+)
 
-doc.add_heading('What is Hibernate?', level=2)
-doc.add_paragraph('Hibernate is the ORM framework that:')
-hibernate_points = [
+HIBERNATE_POINTS = (
     'Generates SQL queries from your Java code',
     'Converts database records to Java objects',
     'Manages entity lifecycle (new, managed, detached, removed)',
     'Handles relationships between entities'
-]
-for point in hibernate_points:
-    doc.add_paragraph(point, style='List Number')
-
-doc.add_heading('Example:', level=3)
-doc.add_paragraph('Instead of writing:')
-sql_example = doc.add_paragraph('SELECT * FROM product WHERE id = 1;', style='List Bullet')
-sql_example.style.font.name = 'Courier New'
-
-doc.add_paragraph('You write:')
-java_example = doc.add_paragraph('Product product = repo.findById(1).orElse(null);', style='List Bullet')
-java_example.style.font.name = 'Courier New'
-
-doc.add_paragraph('Hibernate generates the SQL for you!')
+)
 
-doc.add_heading('JPA vs Hibernate:', level=2)
-jpa_points = [
+JPA_POINTS = (
     'JPA = Standard interface/specification (like a contract)',
     'Hibernate = Implementation of JPA (the actual implementation)',
     'Spring Data JPA = Wrapper around Hibernate that makes it even easier'
-]
-for point in jpa_points:
-    doc.add_paragraph(point, style='List Bullet')
-
-doc.add_heading('Database Table Structure (Auto-generated)', level=2)
-doc.add_paragraph('Your Product class creates this table in H2:')
+)
 
-table_sql = doc.add_paragraph(
+TABLE_SQL = (
     'CREATE TABLE product (\n'
     '    id              INT PRIMARY KEY AUTO_INCREMENT,\n'
     '    name            VARCHAR(255),\n'
@@ -495,38 +507,15 @@ table_sql = doc.add_paragraph(
     '    image_name      VARCHAR(255),\n'
     '    image_type      VARCHAR(255),\n'
     '    image_data      BLOB\n'
-    ');',
-    style='List Bullet'
+    ');'
 )
-table_sql.style.font.name = 'Courier New'
 
-doc.add_heading('How:', level=3)
-how_points = [
+HOW_POINTS = (
     'spring.jpa.hibernate.ddl-auto=update tells Hibernate to automatically create/update tables',
     'Field names map to column names (camelCase → snake_case)'
-]
-for point in how_points:
-    doc.add_paragraph(point, style='List Bullet')
-
-doc.add_page_break()
-
-# ===== SECTION 7: API ENDPOINTS =====
-doc.add_heading('7. API Endpoints', level=1)
-
-# Endpoint 1
-doc.add_heading('Endpoint 1: GET /api/products', level=2)
-doc.add_heading('Purpose:', level=3)
-doc.add_paragraph('Retrieve all products')
-
-doc.add_heading('Request:', level=3)
-req1 = doc.add_paragraph('GET /api/products HTTP/1.1\nHost: localhost:8080')
-req1.style.font.name = 'Courier New'
-
-doc.add_heading('Response (HTTP 200 OK):', level=3)
-doc.add_paragraph('Returns a JSON array of all products with their details (excluding imageData)')
+)
 
-doc.add_heading('Backend Flow:', level=3)
-flow1 = [
+FLOW1 = (
     'Controller receives GET request',
     'Calls service.getAllProducts()',
     'Service calls repo.findAll()',
@@ -534,55 +523,26 @@ flow1 = [
     'Returns List<Product>',
     'Jackson converts to JSON',
     'Returns HTTP 200 OK with JSON body'
-]
-for f in flow1:
-    doc.add_paragraph(f, style='List Number')
-
-# Endpoint 2
-doc.add_heading('Endpoint 2: GET /api/product/{id}', level=2)
-doc.add_heading('Purpose:', level=3)
-doc.add_paragraph('Retrieve a single product by ID')
-
-doc.add_heading('Request:', level=3)
-req2 = doc.add_paragraph('GET /api/product/1 HTTP/1.1\nHost: localhost:8080')
-req2.style.font.name = 'Courier New'
-
-doc.add_heading('Response:', level=3)
-doc.add_paragraph('HTTP 200 OK: Returns the product as JSON')
-doc.add_paragraph('HTTP 404 Not Found: If product does not exist')
+)
 
-doc.add_heading('Backend Flow:', level=3)
-flow2 = [
+FLOW2 = (
     '@PathVariable int id extracts 1 from URL',
     'Controller calls service.getProductById(1)',
     'Service calls repo.findById(1)',
     'Repository generates: SELECT * FROM product WHERE id = 1',
     'If found: returns Product object → HTTP 200 OK',
     'If NOT found: returns null → HTTP 404 Not Found'
-]
-for f in flow2:
-    doc.add_paragraph(f, style='List Number')
-
-# Endpoint 3
-doc.add_heading('Endpoint 3: POST /api/product', level=2)
-doc.add_heading('Purpose:', level=3)
-doc.add_paragraph('Add new product with image')
+)
 
-doc.add_heading('Request:', level=3)
-req3 = doc.add_paragraph(
+REQ3 = (
     'POST /api/product HTTP/1.1\n'
     'Content-Type: multipart/form-data\n\n'
     'FormData:\n'
     '- product: { "name": "Laptop", "brand": "Dell", "price": 79999.99, ... }\n'
     '- imageFile: <binary image data>'
 )
-req3.style.font.name = 'Courier New'
 
-doc.add_heading('Response (HTTP 201 CREATED):', level=3)
-doc.add_paragraph('Returns created product with auto-generated ID')
-
-doc.add_heading('Backend Flow:', level=3)
-flow3 = [
+FLOW3 = (
     '@RequestPart Product product deserializes JSON → Product object',
     '@RequestPart MultipartFile imageFile receives uploaded file',
     'Controller calls service.addProduct(product, imageFile)',
@@ -592,24 +552,9 @@ flow3 = [
     'Database assigns auto-generated ID',
     'Returns saved Product with ID',
     'HTTP 201 CREATED response'
-]
-for f in flow3:
-    doc.add_paragraph(f, style='List Number')
-
-# Endpoint 4
-doc.add_heading('Endpoint 4: GET /api/product/{productId}/image', level=2)
-doc.add_heading('Purpose:', level=3)
-doc.add_paragraph('Download product image')
-
-doc.add_heading('Request:', level=3)
-req4 = doc.add_paragraph('GET /api/product/1/image HTTP/1.1\nHost: localhost:8080')
-req4.style.font.name = 'Courier New'
-
-doc.add_heading('Response (HTTP 200 OK):', level=3)
-doc.add_paragraph('Binary image data with appropriate Content-Type header')
+)
 
-doc.add_heading('Backend Flow:', level=3)
-flow4 = [
+FLOW4 = (
     '@PathVariable int productId extracts 1 from URL',
     'Controller calls service.getProductById(1)',
     'Service queries database',
@@ -617,91 +562,41 @@ flow4 = [
     'Controller sets HTTP response header: Content-Type: image/jpeg',
     'Returns binary data',
     'Browser displays/downloads image'
-]
-for f in flow4:
-    doc.add_paragraph(f, style='List Number')
-
-doc.add_page_break()
-
-# ===== SECTION 8: REQUEST-RESPONSE LIFECYCLE =====
-doc.add_heading('8. Request-Response Lifecycle', level=1)
-
-doc.add_heading('Complete Lifecycle Example: Create Product with Image', level=2)
-
-lifecycle_steps = [
-    {
-        'step': 'CLIENT Sends Request',
-        'details': 'User sends POST /api/product with FormData (product JSON + image file)'
-    },
-    {
-        'step': 'Spring Web Server (Tomcat) Receives Request',
-        'details': 'Tomcat identifies HTTP Method (POST), URL (/api/product), and body (Multipart form data)'
-    },
-    {
-        'step': 'Spring Dispatcher Maps to Controller',
-        'details': 'Spring finds @PostMapping("/product") in ProductController'
-    },
-    {
-        'step': 'Multipart Parser Extracts Data',
-        'details': 'Extracts "product" field (JSON deserized to Product object) and "imageFile" field (MultipartFile wrapper)'
-    },
-    {
-        'step': 'Controller Method Executes',
-        'details': 'ProductController.addProduct(Product, MultipartFile) calls service.addProduct(product, imageFile)'
-    },
-    {
-        'step': 'Service Layer - Business Logic',
-        'details': 'Extracts filename, content-type, and bytes from file. Sets these on Product. Calls repo.save(product)'
-    },
-    {
-        'step': 'Repository Layer - Database Access',
-        'details': 'Hibernate generates: INSERT INTO product (name, brand, price, image_name, image_type, image_data, ...) VALUES (...)'
-    },
-    {
-        'step': 'Database Execution',
-        'details': 'H2 executes INSERT, auto-generates ID, stores row, returns success'
-    },
-    {
-        'step': 'Return Data to Service',
-        'details': 'Hibernate converts database row to Product Java object with auto-generated ID'
-    },
-    {
-        'step': 'Service Returns to Controller',
-        'details': 'Service returns Product { id: 1, name: "Laptop", brand: "Dell", ... }'
-    },
-    {
-        'step': 'Controller Wraps Response',
-        'details': 'Controller returns ResponseEntity.status(201).body(savedProduct). HTTP Status: 201 CREATED'
-    },
-    {
-        'step': 'Jackson Serializes to JSON',
-        'details': 'Jackson converts Product object to JSON (imageData excluded by @JsonIgnore)'
-    },
-    {
-        'step': 'HTTP Response Sent to Client',
-        'details': 'HTTP/1.1 201 Created with JSON body'
-    },
-    {
-        'step': 'Client Receives Response',
-        'details': 'Frontend receives HTTP Status 201 with created product data'
-    }
-]
-
-for num, ls in enumerate(lifecycle_steps, 1):
-    p = doc.add_paragraph()
-    p_run = p.add_run(f'Step {num}: {ls["step"]}')
-    p_run.bold = True
-    p_run.font.size = Pt(12)
-    doc.add_paragraph(ls['details'], style='List Bullet')
-
-doc.add_page_break()
-
-# ===== SUMMARY =====
-doc.add_heading('Summary: How Everything Works Together', level=1)
+)
 
-doc.add_heading('Request Path (What happens when you call an API):', level=2)
+# (step, details)
+LIFECYCLE_STEPS = (
+    ('CLIENT Sends Request',
+     'User sends POST /api/product with FormData (product JSON + image file)'),
+    ('Spring Web Server (Tomcat) Receives Request',
+     'Tomcat identifies HTTP Method (POST), URL (/api/product), and body (Multipart form data)'),
+    ('Spring Dispatcher Maps to Controller',
+     'Spring finds @PostMapping("/product") in ProductController'),
+    ('Multipart Parser Extracts Data',
+     'Extracts "product" field (JSON deserized to Product object) and "imageFile" field (MultipartFile wrapper)'),
+    ('Controller Method Executes',
+     'ProductController.addProduct(Product, MultipartFile) calls service.addProduct(product, imageFile)'),
+    ('Service Layer - Business Logic',
+     'Extracts filename, content-type, and bytes from file. Sets these on Product. Calls repo.save(product)'),
+    ('Repository Layer - Database Access',
+     'Hibernate generates: INSERT INTO product (name, brand, price, image_name, image_type, image_data, ...) VALUES (...)'),
+    ('Database Execution',
+     'H2 executes INSERT, auto-generates ID, stores row, returns success'),
+    ('Return Data to Service',
+     'Hibernate converts database row to Product Java object with auto-generated ID'),
+    ('Service Returns to Controller',
+     'Service returns Product { id: 1, name: "Laptop", brand: "Dell", ... }'),
+    ('Controller Wraps Response',
+     'Controller returns ResponseEntity.status(201).body(savedProduct). HTTP Status: 201 CREATED'),
+    ('Jackson Serializes to JSON',
+     'Jackson converts Product object to JSON (imageData excluded by @JsonIgnore)'),
+    ('HTTP Response Sent to Client',
+     'HTTP/1.1 201 Created with JSON body'),
+    ('Client Receives Response',
+     'Frontend receives HTTP Status 201 with created product data')
+)
 
-request_path = [
+REQUEST_PATH = (
     'HTTP Request',
     'Tomcat (Web Server)',
     'Spring Dispatcher (Router)',
@@ -714,44 +609,25 @@ request_path = [
     'Jackson (Object to JSON)',
     'HTTP Response',
     'Client (Browser/App)'
-]
-
-for path in request_path:
-    if path.startswith('['):
-        doc.add_paragraph(path, style='List Bullet')
-    else:
-        doc.add_paragraph(path, style='List Bullet')
-
-doc.add_heading('Key Concepts Recap:', level=2)
-
-concepts = [
-    ('@RestController', 'Handles REST requests'),
-    ('@RequestMapping', 'URL prefix'),
-    ('@GetMapping/@PostMapping', 'HTTP method + URL routing'),
-    ('@Autowired', 'Dependency Injection (automatic wiring)'),
-    ('@Entity', 'Database table'),
-    ('@Id @GeneratedValue', 'Primary Key with auto-increment'),
-    ('@Lob', 'Large binary data (images)'),
-    ('@Lazy', 'Load data only when needed'),
-    ('@JsonIgnore', 'Don\'t include in JSON response'),
-    ('JpaRepository', 'Pre-built database access methods'),
-    ('Service', 'Business logic layer'),
-    ('DTO', 'Data Transfer Object (if needed for specific responses)')
-]
-
-for concept, explanation in concepts:
-    p = doc.add_paragraph()
-    p_run = p.add_run(concept)
-    p_run.bold = True
-    p.add_run(f' = {explanation}')
-
-doc.add_page_break()
+)
 
-# ===== NEXT STEPS =====
-doc.add_heading('Next Steps for Learning', level=1)
-doc.add_paragraph('Now that you understand the architecture, you can enhance your project by implementing:')
+# (concept, explanation)
+CONCEPTS = (
+    ('@RestController', ' = Handles REST requests'),
+    ('@RequestMapping', ' = URL prefix'),
+    ('@GetMapping/@PostMapping', ' = HTTP method + URL routing'),
+    ('@Autowired', ' = Dependency Injection (automatic wiring)'),
+    ('@Entity', ' = Database table'),
+    ('@Id @GeneratedValue', ' = Primary Key with auto-increment'),
+    ('@Lob', ' = Large binary data (images)'),
+    ('@Lazy', ' = Load data only when needed'),
+    ('@JsonIgnore', ' = Don\'t include in JSON response'),
+    ('JpaRepository', ' = Pre-built database access methods'),
+    ('Service', ' = Business logic layer'),
+    ('DTO', ' = Data Transfer Object (if needed for specific responses)')
+)
 
-next_steps = [
+NEXT_STEP_ITEMS = (
     'Add a DELETE endpoint (@DeleteMapping) to remove products',
     'Add an UPDATE endpoint (@PutMapping) to modify products',
     'Add custom search methods in ProductRepo to find products by category/brand',
@@ -762,22 +638,276 @@ next_steps = [
     'Add unit tests for service and controller methods',
     'Implement role-based access control (authentication & authorization)',
     'Add API documentation using Swagger/SpringFox'
-]
+)
+
+# Title
+TITLE_PAGE = (
+    ('emphasis', 'Spring Boot E-Commerce Backend',
+     {'size': PT28, 'bold': True, 'color': DARK_BLUE, 'centered': True}),
+    ('emphasis', 'Complete Architecture Guide',
+     {'size': PT18, 'italic': True, 'color': MID_BLUE, 'centered': True}),
+    ('para',),
+)
+
+# Table of Contents
+TABLE_OF_CONTENTS = (
+    ('heading', 1, 'Table of Contents'),
+    ('bullets', TOC_ITEMS),
+    ('page_break',),
+)
+
+# ===== SECTION 1: OVERVIEW =====
+OVERVIEW = (
+    ('heading', 1, '1. Overview'),
+    ('para', 'Your project is a REST API backend for an e-commerce application that allows users to:'),
+    ('bullets', OVERVIEW_ITEMS),
+    ('para',),
+    ('para', 'The architecture follows the Layered/Tier Architecture pattern:'),
+    # Architecture diagram
+    ('bold', 'Client (Browser/Mobile App)\n'),
+    ('bullets', ('↓',)),
+    ('pairs', (('Controller Layer', ' ← Handles HTTP requests/responses'),)),
+    ('bullets', ('↓',)),
+    ('pairs', (('Service Layer', ' ← Business logic'),)),
+    ('bullets', ('↓',)),
+    ('pairs', (('Repository Layer', ' ← Database access'),)),
+    ('bullets', ('↓',)),
+    ('pairs', (('Database (H2)', ' ← Data storage'),)),
+    ('page_break',),
+)
+
+# ===== SECTION 2: ARCHITECTURE & FLOW =====
+ARCHITECTURE = (
+    ('heading', 1, '2. Architecture & Flow'),
+    ('heading', 2, 'Layer 1: Controller Layer (ProductController.java)'),
+    ('heading', 3, 'Purpose:'),
+    ('para', 'Handle incoming HTTP requests and send responses back to clients.'),
+    ('heading', 3, 'How it works:'),
+    ('bullets', CONTROLLER_POINTS),
+    ('heading', 3, 'Your Controllers:'),
+    ('table', CONTROLLER_TABLE),
+    ('para',),
+    ('heading', 2, 'Layer 2: Service Layer (ProductService.java)'),
+    ('heading', 3, 'Purpose:'),
+    ('para', 'Contains business logic, data validation, and orchestration.'),
+    ('heading', 3, 'How it works:'),
+    ('bullets', SERVICE_POINTS),
+    ('heading', 3, 'Your Service Methods:'),
+    ('bullets', SERVICE_METHODS),
+    ('heading', 2, 'Layer 3: Repository Layer (ProductRepo.java)'),
+    ('heading', 3, 'Purpose:'),
+    ('para', 'Database access abstraction. Uses Spring Data JPA.'),
+    ('heading', 3, 'How it works:'),
+    ('bullets', REPO_POINTS),
+    ('heading', 3, 'What JpaRepository provides (out of the box):'),
+    ('bullets', JPA_METHODS),
+    ('heading', 2, 'Layer 4: Model/Entity Layer (Product.java)'),
+    ('heading', 3, 'Purpose:'),
+    ('para', 'Defines the database table structure as a Java class.'),
+    ('heading', 3, 'How it works:'),
+    ('bullets', MODEL_POINTS),
+    ('heading', 2, 'Layer 5: Database (H2 In-Memory)'),
+    ('heading', 3, 'Purpose:'),
+    ('para', 'Stores all data persistently (during runtime).'),
+    ('heading', 3, 'Current Setup:'),
+    ('bullets', DB_SETUP),
+    ('page_break',),
+)
+
+# ===== SECTION 3: TECHNOLOGY STACK =====
+TECHNOLOGY_STACK = (
+    ('heading', 1, '3. Technology Stack'),
+    ('heading', 2, 'Dependencies (from pom.xml):'),
+    ('glossary', DEPENDENCIES),
+    ('page_break',),
+)
+
+# ===== SECTION 4: HOW COMPONENTS CONNECT =====
+COMPONENTS = (
+    ('heading', 1, '4. How Components Connect'),
+    ('heading', 2, 'Example 1: GET /api/products Request Flow'),
+    ('steps', FLOW_STEPS),
+    ('para',),
+    ('heading', 2, 'Example 2: POST /api/product Request Flow (with Image Upload)'),
+    ('steps', FLOW_STEPS_2),
+    ('page_break',),
+)
+
+# ===== SECTION 5: KEY ANNOTATIONS =====
+KEY_ANNOTATIONS = (
+    ('heading', 1, '5. Key Annotations Explained'),
+    ('heading', 2, 'Controller Annotations'),
+    ('annotations', ANNOTATIONS),
+    ('heading', 2, 'Entity/Model Annotations'),
+    ('entries', ENTITY_ANNOTATIONS),
+    ('heading', 2, 'Service Annotations'),
+    ('entries', SERVICE_ANNOTATIONS),
+    ('heading', 2, 'Repository Annotations'),
+    ('entries', (('@Repository', 'Tells Spring: "This is a data access object". Enables automatic SQL generation. <Product, Integer> = Entity type, Primary Key type.'),)),
+    ('page_break',),
+)
+
+# ===== SECTION 6: DATABASE & ORM =====
+DATABASE_ORM = (
+    ('heading', 1, '6. Database & ORM Concepts'),
+    ('heading', 2, 'What is ORM (Object-Relational Mapping)?'),
+    ('para', 'ORM bridges Java objects and database tables:'),
+    ('para',),
+    ('bullets', ORM_POINTS),
+    ('heading', 3, 'Benefits:'),
+    ('bullets', BENEFITS),
+    ('heading', 2, 'What is Hibernate?'),
+    ('para', 'Hibernate is the ORM framework that:'),
+    ('numbers', HIBERNATE_POINTS),
+    ('heading', 3, 'Example:'),
+    ('para', 'Instead of writing:'),
+    ('code', 'SELECT * FROM product WHERE id = 1;'),
+    ('para', 'You write:'),
+    ('code', 'Product product = repo.findById(1).orElse(null);'),
+    ('para', 'Hibernate generates the SQL for you!'),
+    ('heading', 2, 'JPA vs Hibernate:'),
+    ('bullets', JPA_POINTS),
+    ('heading', 2, 'Database Table Structure (Auto-generated)'),
+    ('para', 'Your Product class creates this table in H2:'),
+    ('code', TABLE_SQL),
+    ('heading', 3, 'How:'),
+    ('bullets', HOW_POINTS),
+    ('page_break',),
+)
+
+# ===== SECTION 7: API ENDPOINTS =====
+API_ENDPOINTS = (
+    ('heading', 1, '7. API Endpoints'),
+    # Endpoint 1
+    ('heading', 2, 'Endpoint 1: GET /api/products'),
+    ('heading', 3, 'Purpose:'),
+    ('para', 'Retrieve all products'),
+    ('heading', 3, 'Request:'),
+    ('code', 'GET /api/products HTTP/1.1\nHost: localhost:8080', None),
+    ('heading', 3, 'Response (HTTP 200 OK):'),
+    ('para', 'Returns a JSON array of all products with their details (excluding imageData)'),
+    ('heading', 3, 'Backend Flow:'),
+    ('numbers', FLOW1),
+    # Endpoint 2
+    ('heading', 2, 'Endpoint 2: GET /api/product/{id}'),
+    ('heading', 3, 'Purpose:'),
+    ('para', 'Retrieve a single product by ID'),
+    ('heading', 3, 'Request:'),
+    ('code', 'GET /api/product/1 HTTP/1.1\nHost: localhost:8080', None),
+    ('heading', 3, 'Response:'),
+    ('para', 'HTTP 200 OK: Returns the product as JSON'),
+    ('para', 'HTTP 404 Not Found: If product does not exist'),
+    ('heading', 3, 'Backend Flow:'),
+    ('numbers', FLOW2),
+    # Endpoint 3
+    ('heading', 2, 'Endpoint 3: POST /api/product'),
+    ('heading', 3, 'Purpose:'),
+    ('para', 'Add new product with image'),
+    ('heading', 3, 'Request:'),
+    ('code', REQ3, None),
+    ('heading', 3, 'Response (HTTP 201 CREATED):'),
+    ('para', 'Returns created product with auto-generated ID'),
+    ('heading', 3, 'Backend Flow:'),
+    ('numbers', FLOW3),
+    # Endpoint 4
+    ('heading', 2, 'Endpoint 4: GET /api/product/{productId}/image'),
+    ('heading', 3, 'Purpose:'),
+    ('para', 'Download product image'),
+    ('heading', 3, 'Request:'),
+    ('code', 'GET /api/product/1/image HTTP/1.1\nHost: localhost:8080', None),
+    ('heading', 3, 'Response (HTTP 200 OK):'),
+    ('para', 'Binary image data with appropriate Content-Type header'),
+    ('heading', 3, 'Backend Flow:'),
+    ('numbers', FLOW4),
+    ('page_break',),
+)
+
+# ===== SECTION 8: REQUEST-RESPONSE LIFECYCLE =====
+LIFECYCLE = (
+    ('heading', 1, '8. Request-Response Lifecycle'),
+    ('heading', 2, 'Complete Lifecycle Example: Create Product with Image'),
+    ('lifecycle', LIFECYCLE_STEPS),
+    ('page_break',),
+)
+
+# ===== SUMMARY =====
+SUMMARY = (
+    ('heading', 1, 'Summary: How Everything Works Together'),
+    ('heading', 2, 'Request Path (What happens when you call an API):'),
+    ('bullets', REQUEST_PATH),
+    ('heading', 2, 'Key Concepts Recap:'),
+    ('pairs', CONCEPTS),
+    ('page_break',),
+)
+
+# ===== NEXT STEPS =====
+NEXT_STEPS = (
+    ('heading', 1, 'Next Steps for Learning'),
+    ('para', 'Now that you understand the architecture, you can enhance your project by implementing:'),
+    ('numbers', NEXT_STEP_ITEMS),
+    # Final note
+    ('emphasis', 'Your project is now ready for these enhancements!',
+     {'size': PT12, 'bold': True, 'color': GREEN}),
+)
+
+SECTIONS = (
+    TITLE_PAGE,
+    TABLE_OF_CONTENTS,
+    OVERVIEW,
+    ARCHITECTURE,
+    TECHNOLOGY_STACK,
+    COMPONENTS,
+    KEY_ANNOTATIONS,
+    DATABASE_ORM,
+    API_ENDPOINTS,
+    LIFECYCLE,
+    SUMMARY,
+    NEXT_STEPS,
+)
+
+
+def render_section(section):
+    chunks = []
+    for kind, *args in section:
+        chunks += DISPATCH[kind](*args)
+    return chunks
+
+
+def main():
+    output_path = r'C:\Users\z00542kh\Desktop\ecom-proj\Spring_Boot_Architecture_Guide.docx'
+
+    # Every input is a literal in this file, so an unchanged script means an
+    # unchanged document: skip the rebuild when the last one is still current
+    with open(__file__, 'rb') as f:
+        key = hashlib.blake2b(f.read()).hexdigest()
+    marker = output_path + '.hash'
+    if os.path.exists(output_path) and os.path.exists(marker):
+        with open(marker) as f:
+            if f.read() == key:
+                print("Word document is up to date.")
+                print(f"Location: {output_path}")
+                return
+
+    for section in SECTIONS:
+        append_elements(render_section(section))
 
-for num, step in enumerate(next_steps, 1):
-    doc.add_paragraph(step, style='List Number')
+    # Save the document
+    # Serialize in memory, then hand the whole package to the OS in one write
+    buf = io.BytesIO()
+    doc.save(buf)
+    data = buf.getbuffer()
+    with open(output_path, 'wb', buffering=max(1 << 20, len(data))) as f:
+        f.write(data)
 
-# Final note
-final_note = doc.add_paragraph()
-final_note_run = final_note.add_run('Your project is now ready for these enhancements!')
-final_note_run.bold = True
-final_note_run.font.size = Pt(12)
-final_note_run.font.color.rgb = RGBColor(0, 102, 0)
+    # Record the key only once the document is fully written
+    tmp_marker = marker + '.tmp'
+    with open(tmp_marker, 'w') as f:
+        f.write(key)
+    os.replace(tmp_marker, marker)
 
-# Save the document
-output_path = r'C:\Users\z00542kh\Desktop\ecom-proj\Spring_Boot_Architecture_Guide.docx'
-doc.save(output_path)
+    print(f"Word document created successfully!")
+    print(f"Location: {output_path}")
 
-print(f"Word document created successfully!")
-print(f"Location: {output_path}")
 
+if __name__ == '__main__':
+    main()